@@ -6,7 +6,43 @@ report to stdout. Windows elevation is requested automatically when needed.
 """
 
 import sys, os, ctypes, json, subprocess, argparse, logging, time
-from typing import List, Dict, Any, Callable
+import atexit
+import getpass
+import importlib
+import multiprocessing
+import platform
+import queue
+import signal
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+from typing import List, Dict, Any, Callable, Mapping, Optional, Tuple, cast
+
+# Optional fast JSON parser for plan input; stdlib json is the fallback.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+# need to handle the stdlib exception.
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+# Used to kill a timed-out isolated task's whole process tree.
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Reusable no-op stand-in for a Sentry task span (enters as None).
+_NULL_SPAN = nullcontext()
 
 # Import Sentry configuration early for error tracking
 try:
@@ -23,7 +59,7 @@ except ImportError:
     SENTRY_AVAILABLE = False
 
     # Define no-op fallbacks if sentry_config is not available
-    def init_sentry():
+    def init_sentry(*args, **kwargs):
         return False
 
     def capture_task_exception(
@@ -37,29 +73,59 @@ except ImportError:
         return None
 
     def create_task_span(task_type, task_index, total_tasks, task_data=None):
-        from contextlib import contextmanager
+        return _NULL_SPAN
 
-        @contextmanager
-        def _noop():
-            yield None
+    add_breadcrumb = lambda *args, **kwargs: None  # noqa: E731
 
-        return _noop()
 
-    def add_breadcrumb(message, category="info", level="info", **data):
-        pass
+# shell32!IsUserAnAdmin, resolved once at import (Windows only).
+_IsUserAnAdmin = None
+if os.name == "nt":
+    try:
+        _IsUserAnAdmin = ctypes.windll.shell32.IsUserAnAdmin
+        _IsUserAnAdmin.restype = ctypes.c_int
+    except Exception:  # noqa: BLE001
+        _IsUserAnAdmin = None
 
 
+@lru_cache(maxsize=1)
 def is_admin():
     """Return True if the current process is running with administrator rights.
 
-    On non-Windows platforms, returns False if the check fails.
+    Always False on non-Windows platforms. The result is cached since a
+    process's elevation can't change while it runs.
     """
+    if _IsUserAnAdmin is None:
+        return False
     try:
-        return ctypes.windll.shell32.IsUserAnAdmin()
-    except:
+        return bool(_IsUserAnAdmin())
+    except Exception:  # noqa: BLE001
         return False
 
 
+@lru_cache(maxsize=1)
+def _system_metadata() -> Mapping[str, str]:
+    """Host details stamped on every report; fixed for the process lifetime.
+
+    On Windows the version comes from ``sys.getwindowsversion()`` (same
+    ``major.minor.build`` form) because ``platform.version()`` may shell out
+    to ``ver`` or query WMI to produce it.
+    """
+    if sys.platform == "win32":
+        winver = sys.getwindowsversion()
+        os_version = f"{winver.major}.{winver.minor}.{winver.build}"
+    else:
+        os_version = platform.version()
+    return MappingProxyType(
+        {
+            "hostname": platform.node(),
+            "username": getpass.getuser(),
+            "os_name": platform.system(),
+            "os_version": os_version,
+        }
+    )
+
+
 def relaunch_elevated(argv: List[str]) -> int:
     """Attempt to relaunch this executable elevated.
 
@@ -69,8 +135,9 @@ def relaunch_elevated(argv: List[str]) -> int:
     try:
         # Use the current executable so this works for both python.exe and PyInstaller exe
         exe_path = sys.executable
-        # Build parameter string excluding the executable itself
-        params = " ".join([f'"{a}"' for a in argv])
+        # Build parameter string excluding the executable itself, using the
+        # same quoting rules CommandLineToArgvW applies when parsing it back.
+        params = subprocess.list2cmdline(argv)
         ShellExecuteW = ctypes.windll.shell32.ShellExecuteW
         ShellExecuteW.restype = ctypes.c_void_p
         rc = ShellExecuteW(None, "runas", exe_path, params, None, 1)
@@ -84,29 +151,6 @@ def relaunch_elevated(argv: List[str]) -> int:
         return 1
 
 
-# Local service imports
-from services.bleachbit_service import run_bleachbit_clean  # type: ignore
-from services.adwcleaner_service import run_adwcleaner_clean  # type: ignore
-from services.furmark_service import run_furmark_test  # type: ignore
-from services.heavyload_service import run_heavyload_stress_test  # type: ignore
-from services.smartctl_service import run_smartctl_report  # type: ignore
-from services.sfc_service import run_sfc_scan  # type: ignore
-from services.dism_service import run_dism_health_check  # type: ignore
-from services.ai_startup_service import run_ai_startup_disable  # type: ignore
-from services.ai_browser_notification_service import run_ai_browser_notification_disable  # type: ignore
-from services.ping_service import run_ping_test  # type: ignore
-from services.chkdsk_service import run_chkdsk_scan  # type: ignore
-from services.iperf_service import run_iperf_test  # type: ignore
-from services.kvrt_service import run_kvrt_scan  # type: ignore
-from services.speedtest_service import run_speedtest  # type: ignore
-from services.windows_update_service import run_windows_update  # type: ignore
-from services.whynotwin11_service import run_whynotwin11_check  # type: ignore
-from services.winsat_service import run_winsat_disk  # type: ignore
-from services.disk_space_service import run_disk_space_report  # type: ignore
-from services.battery_service import run_battery_health_report  # type: ignore
-from services.drivecleanup_service import run_drivecleanup_clean  # type: ignore
-from services.trellix_stinger_service import run_trellix_stinger_scan  # type: ignore
-
 """NOTE ON REAL-TIME LOG STREAMING
 
 Historically the UI only received task status updates after all tasks finished.
@@ -116,97 +160,955 @@ Root causes observed on Windows when launching via PowerShell / Tauri shell:
 
 Mitigations implemented below:
   * Force stdout/stderr into (best-effort) line-buffered / unbuffered modes
-  * Provide a helper flush_logs() and call it immediately after each marker line
+  * Provide a helper flush_logs() and call it at the UI's sync points: after
+    TASK_START and after each PROGRESS_JSON line (line-buffered stderr covers
+    the lines in between)
   * Keep log format minimal so the UI regex ( ^TASK_START etc.) matches directly
 """
 
+# Module-level setup below must only run once per process, even if this module
+# is imported a second time (e.g. as both __main__ and service_runner).
+_SETUP_SENTINEL = "_autoservice_configured"
+
 # Attempt to force line buffering / unbuffered behavior for Python >=3.7
-try:  # pragma: no cover - defensive
-    _reconf_out = getattr(sys.stdout, "reconfigure", None)
-    if callable(_reconf_out):  # type: ignore[attr-defined]
-        try:
-            _reconf_out(line_buffering=True, write_through=True)  # type: ignore[call-arg]
-        except Exception:
-            pass
-    _reconf_err = getattr(sys.stderr, "reconfigure", None)
-    if callable(_reconf_err):  # type: ignore[attr-defined]
-        try:
-            _reconf_err(line_buffering=True, write_through=True)  # type: ignore[call-arg]
-        except Exception:
-            pass
-except Exception:  # noqa: BLE001
-    pass
+if not getattr(sys, _SETUP_SENTINEL, False):
+    try:  # pragma: no cover - defensive
+        _reconf_out = getattr(sys.stdout, "reconfigure", None)
+        if callable(_reconf_out):  # type: ignore[attr-defined]
+            try:
+                _reconf_out(line_buffering=True, write_through=True)  # type: ignore[call-arg]
+            except Exception:
+                pass
+        _reconf_err = getattr(sys.stderr, "reconfigure", None)
+        if callable(_reconf_err):  # type: ignore[attr-defined]
+            try:
+                # The app decodes stderr lines as UTF-8; don't let a legacy
+                # console code page (e.g. cp1252 on a pipe) garble them.
+                _reconf_err(  # type: ignore[call-arg]
+                    encoding="utf-8",
+                    errors="replace",
+                    line_buffering=True,
+                    write_through=True,
+                )
+            except Exception:
+                pass
+    except Exception:  # noqa: BLE001
+        pass
+    setattr(sys, _SETUP_SENTINEL, True)
 
 # Configure logging to stderr for live streaming to the UI (message only).
 _DEFAULT_LOG_FMT = "%(message)s"
-logging.basicConfig(
-    level=logging.INFO, stream=sys.stderr, format=_DEFAULT_LOG_FMT, force=True
-)
+if not getattr(logging.getLogger(), _SETUP_SENTINEL, False):
+    logging.basicConfig(
+        level=logging.INFO, stream=sys.stderr, format=_DEFAULT_LOG_FMT, force=True
+    )
+    setattr(logging.getLogger(), _SETUP_SENTINEL, True)
 
+# Runner records go through one named logger (propagating to the root
+# handlers, so stderr and --log-file still receive every line).
+_LOG = logging.getLogger("autoservice.runner")
+_log_info = _LOG.info
 
-def flush_logs():  # pragma: no cover - simple utility
-    """Flush all logging handlers & stdio to push incremental lines to UI ASAP."""
-    try:
-        for h in logging.getLogger().handlers:
+
+# Background writer for log records; see start_log_listener().
+_log_listener: Optional[QueueListener] = None
+_log_queue: "Optional[queue.Queue[logging.LogRecord]]" = None
+
+# Handlers flush_logs() needs to push, captured when handlers are (re)wired.
+# Only file handlers buffer; the stderr StreamHandler flushes every record.
+_flush_handlers: Tuple[logging.Handler, ...] = ()
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that coalesces writes and flushes only at task boundaries.
+
+    The stock handler flushes after every record, costing one write() per log
+    line. Here lines collect in a user-space buffer and are pushed to disk when
+    a status marker or PROGRESS_JSON line is written (the UI's legacy path tails
+    this file for exactly those), on warnings/errors, or when the buffer fills.
+    ``flush()`` is a no-op until something new has been buffered, so repeated
+    flush_logs() calls with no logging in between cost no syscall.
+    """
+
+    BOUNDARY_PREFIXES = ("TASK_", "PROGRESS_JSON")
+
+    def __init__(
+        self, filename: str, encoding: str = "utf-8", buffer_size: int = 64 * 1024
+    ):
+        self.buffer_size = buffer_size
+        self._dirty = False
+        super().__init__(filename, encoding=encoding)
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record)
+            self.stream.write(msg + self.terminator)
+            if record.levelno >= logging.WARNING or msg.startswith(
+                self.BOUNDARY_PREFIXES
+            ):
+                self.stream.flush()
+                self._dirty = False
+            else:
+                self._dirty = True
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        # emit() runs under the same lock, so the dirty bit can't be missed.
+        with self.lock:
+            if self._dirty and self.stream is not None:
+                self.stream.flush()
+                self._dirty = False
+
+
+def start_log_listener(file_handler: Optional[logging.Handler] = None) -> None:
+    """Route root logging through a queue drained by a background thread.
+
+    Tasks only pay for enqueueing a record; the stderr stream and optional log
+    file are written by the listener thread, so slow disks (or antivirus
+    scanning the log file) no longer stall task execution.
+    """
+    global _log_listener, _log_queue, _flush_handlers
+    if _log_listener is not None:
+        return
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    if file_handler is not None:
+        handlers.append(file_handler)
+    _flush_handlers = tuple(h for h in handlers if isinstance(h, logging.FileHandler))
+    _log_queue = queue.Queue(-1)
+    for h in root.handlers[:]:
+        root.removeHandler(h)
+    root.addHandler(QueueHandler(_log_queue))
+    _log_listener = QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    # Drain queued records on shutdown, including sys.exit() paths.
+    atexit.register(stop_log_listener)
+
+
+def stop_log_listener(fsync: bool = False) -> None:
+    """Drain queued records, stop the listener and restore direct handlers.
+
+    With ``fsync`` set, the log file is synced to disk once here rather than
+    after every line. Safe to call more than once.
+    """
+    global _log_listener, _log_queue
+    listener, _log_listener = _log_listener, None
+    if listener is None:
+        return
+    _log_queue = None
+    listener.stop()
+    root = logging.getLogger()
+    for h in root.handlers[:]:
+        if isinstance(h, QueueHandler):
+            root.removeHandler(h)
+    for h in listener.handlers:
+        root.addHandler(h)
+        if fsync and isinstance(h, logging.FileHandler) and h.stream is not None:
             try:
                 h.flush()
-                # Force underlying OS write for file handlers to minimize buffering delays
-                stream = getattr(h, "stream", None)
-                if stream is not None and hasattr(stream, "fileno"):
-                    try:
-                        os.fsync(stream.fileno())  # type: ignore[arg-type]
-                    except Exception:
-                        pass
-            except Exception:
+                os.fsync(h.stream.fileno())
+            except Exception:  # noqa: BLE001
                 pass
+
+
+def flush_logs():  # pragma: no cover - simple utility
+    """Flush the log file handler(s) to push incremental lines to UI ASAP.
+
+    While the listener runs, first wait for it to write every record already
+    queued, so a TASK_START marker reaches stderr before an isolated worker
+    (which writes to the stream directly) can print anything for that task.
+    The handler set is captured once in start_log_listener(). Only
+    Python-level buffers are flushed; forcing every line to disk with
+    fsync cost a storage round-trip per line. sys.stderr itself is not
+    flushed here: it is reconfigured line-buffered with write_through, and
+    its StreamHandler flushes after every record anyway.
+    """
+    log_queue = _log_queue
+    if log_queue is not None:
+        # QueueListener marks each record task_done once it is handled.
+        log_queue.join()
+    for h in _flush_handlers:
         try:
-            sys.stderr.flush()
-        except Exception:
-            pass
-        try:
-            sys.stdout.flush()
+            h.flush()
         except Exception:
             pass
-    except Exception:
-        pass
 
 
 # Truncation threshold for log snippets to keep logs readable in the UI.
 MAX_LOG_SNIPPET: int = 200
 
+# Pre-built PROGRESS_JSON_FINAL line; only the variable fields are spliced in
+# so the constant skeleton is not re-serialized at the end of every run.
+_FINAL_PROGRESS_TEMPLATE = (
+    'PROGRESS_JSON_FINAL:{"type":"final","completed":%d,"total":%d,'
+    '"results":%s,"overall_status":%s}'
+)
+
 # Type aliases for better readability.
 Task = Dict[str, Any]
 TaskResult = Dict[str, Any]
 TaskHandler = Callable[[Task], TaskResult]
 
+# Set once Sentry is initialised for this run. Breadcrumb/capture sites check it
+# first so a disabled Sentry doesn't cost a kwargs and context dict per call.
+_sentry_active: bool = False
+
+# Shared read-only default for missing mappings so lookups like
+# ``(result.get("summary") or _EMPTY).get(...)`` don't allocate a dict per miss.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 
 # --- Modular Task Dispatcher ---
 # To add a new tool (e.g., 'kvrt_scan'), add a new function like 'run_kvrt_scan'
-# and then add it to this dictionary.
-TASK_HANDLERS: Dict[str, TaskHandler] = {
-    "bleachbit_clean": run_bleachbit_clean,
-    "adwcleaner_clean": run_adwcleaner_clean,
-    "furmark_stress_test": run_furmark_test,
-    "heavyload_stress_test": run_heavyload_stress_test,
-    "smartctl_report": run_smartctl_report,
-    "sfc_scan": run_sfc_scan,
-    "dism_health_check": run_dism_health_check,
-    "ai_startup_disable": run_ai_startup_disable,
-    "ai_browser_notification_disable": run_ai_browser_notification_disable,
-    "ping_test": run_ping_test,
-    "chkdsk_scan": run_chkdsk_scan,
-    "iperf_test": run_iperf_test,
-    "kvrt_scan": run_kvrt_scan,
-    "speedtest": run_speedtest,
-    "windows_update": run_windows_update,
-    "whynotwin11_check": run_whynotwin11_check,
-    "winsat_disk": run_winsat_disk,
-    "disk_space_report": run_disk_space_report,
-    "battery_health_report": run_battery_health_report,
-    "drivecleanup_clean": run_drivecleanup_clean,
-    "trellix_stinger_scan": run_trellix_stinger_scan,
-    # "windows_defender_scan": run_windows_defender_scan, # Example for the future
+# in services/ and then map the task type to its (module, function) here.
+# Service modules are imported on first use so a run only pays the import cost
+# (requests, psutil, WMI, ...) of the handlers its plan actually references.
+HANDLER_SPECS: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    "bleachbit_clean": ("services.bleachbit_service", "run_bleachbit_clean"),
+    "adwcleaner_clean": ("services.adwcleaner_service", "run_adwcleaner_clean"),
+    "furmark_stress_test": ("services.furmark_service", "run_furmark_test"),
+    "heavyload_stress_test": (
+        "services.heavyload_service",
+        "run_heavyload_stress_test",
+    ),
+    "smartctl_report": ("services.smartctl_service", "run_smartctl_report"),
+    "sfc_scan": ("services.sfc_service", "run_sfc_scan"),
+    "dism_health_check": ("services.dism_service", "run_dism_health_check"),
+    "ai_startup_disable": ("services.ai_startup_service", "run_ai_startup_disable"),
+    "ai_browser_notification_disable": (
+        "services.ai_browser_notification_service",
+        "run_ai_browser_notification_disable",
+    ),
+    "ping_test": ("services.ping_service", "run_ping_test"),
+    "chkdsk_scan": ("services.chkdsk_service", "run_chkdsk_scan"),
+    "iperf_test": ("services.iperf_service", "run_iperf_test"),
+    "kvrt_scan": ("services.kvrt_service", "run_kvrt_scan"),
+    "speedtest": ("services.speedtest_service", "run_speedtest"),
+    "windows_update": ("services.windows_update_service", "run_windows_update"),
+    "whynotwin11_check": ("services.whynotwin11_service", "run_whynotwin11_check"),
+    "winsat_disk": ("services.winsat_service", "run_winsat_disk"),
+    "disk_space_report": ("services.disk_space_service", "run_disk_space_report"),
+    "battery_health_report": (
+        "services.battery_service",
+        "run_battery_health_report",
+    ),
+    "drivecleanup_clean": ("services.drivecleanup_service", "run_drivecleanup_clean"),
+    "trellix_stinger_scan": (
+        "services.trellix_stinger_service",
+        "run_trellix_stinger_scan",
+    ),
+    # "windows_defender_scan": ("services.defender_service", "run_windows_defender_scan"),
+})
+# Read-only at runtime; bind the lookup once for the per-task dispatch check.
+_handler_spec = HANDLER_SPECS.get
+
+
+@lru_cache(maxsize=None)
+def _get_handler(task_type: str) -> TaskHandler:
+    """Import and return the handler for ``task_type``.
+
+    Raises KeyError for unknown task types; import errors propagate so the
+    caller can report them as a task failure.
+    """
+    spec = _handler_spec(task_type)
+    if spec is None:
+        raise KeyError(task_type)
+    module_name, func_name = spec
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+# --- Parallel Task Execution ---
+# Worker threads used when a plan sets "parallel_execution" (or --max-parallel).
+DEFAULT_MAX_PARALLEL: int = 4
+
+# Task types that must never overlap with other tasks: system repair/scan tools
+# that contend for the same OS components, and stress tests/benchmarks whose
+# results would be skewed by concurrent load. A task may override this with
+# an explicit "exclusive": true/false.
+EXCLUSIVE_TASK_TYPES = frozenset(
+    {
+        "sfc_scan",
+        "dism_health_check",
+        "chkdsk_scan",
+        "windows_update",
+        "furmark_stress_test",
+        "heavyload_stress_test",
+        "winsat_disk",
+        "speedtest",
+        "iperf_test",
+    }
+)
+
+# Rough relative run time per task type (unknown types default to
+# _DEFAULT_TASK_COST). Only the ordering matters, not the absolute values.
+_TASK_COST: Dict[str, int] = {
+    "furmark_stress_test": 100,
+    "heavyload_stress_test": 100,
+    "kvrt_scan": 90,
+    "trellix_stinger_scan": 90,
+    "windows_update": 90,
+    "chkdsk_scan": 80,
+    "sfc_scan": 60,
+    "dism_health_check": 60,
+    "adwcleaner_clean": 40,
+    "bleachbit_clean": 30,
+    "winsat_disk": 30,
+    "drivecleanup_clean": 20,
+    "smartctl_report": 10,
+    "speedtest": 10,
+    "iperf_test": 10,
+    "ping_test": 5,
+    "whynotwin11_check": 5,
+    "ai_startup_disable": 2,
+    "ai_browser_notification_disable": 2,
+    "disk_space_report": 1,
+    "battery_health_report": 1,
 }
+_DEFAULT_TASK_COST = 50
+
+# Tasks at or below this cost finish in about a second; they are submitted to
+# the pool in groups of up to _CHEAP_BATCH_SIZE to save a Future per task.
+_CHEAP_TASK_COST = 5
+_CHEAP_BATCH_SIZE = 4
+
+# Shared task thread pools, one per tier ("fast" for batches of cheap tasks,
+# "slow" for everything else), created on first use and reused after.
+_task_executors: Dict[str, ThreadPoolExecutor] = {}
+_task_executor_lock = threading.Lock()
+
+
+def _get_task_executor(tier: str, max_workers: int) -> ThreadPoolExecutor:
+    """Return the shared thread pool for ``tier``, creating it on first use."""
+    with _task_executor_lock:
+        executor = _task_executors.get(tier)
+        if executor is None:
+            if not _task_executors:
+                atexit.register(_shutdown_task_executor)
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=f"svc-{tier}"
+            )
+            _task_executors[tier] = executor
+        return executor
+
+
+def _shutdown_task_executor() -> None:
+    """Wait for running tasks and release the shared task thread pools."""
+    with _task_executor_lock:
+        executors = list(_task_executors.values())
+        _task_executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+# --- Isolated Task Execution ---
+# Plans may set "isolate_tasks": true to run each handler in a spawned worker
+# process. Every running task has a single-worker executor of its own, so a
+# handler that crashes the interpreter (or hangs past its optional
+# "timeout_seconds") only takes down its own worker: a shared pool would mark
+# itself broken and fail every task running alongside it. Healthy workers are
+# parked for reuse so later tasks skip the interpreter spawn.
+ISOLATED_MAX_WORKERS: int = 4  # started up front / kept idle for reuse
+_idle_isolated_workers: List[ProcessPoolExecutor] = []
+_isolated_workers_lock = threading.Lock()
+
+
+def _init_isolated_worker(log_file: Optional[str]) -> None:
+    """Mirror worker log lines into the run's log file (stderr is inherited)."""
+    if not log_file:
+        return
+    try:
+        # delay: pre-warmed workers that never run a task never open the file.
+        fh = logging.FileHandler(log_file, encoding="utf-8", delay=True)
+        fh.setFormatter(logging.Formatter(_DEFAULT_LOG_FMT))
+        logging.getLogger().addHandler(fh)
+    except Exception:  # noqa: BLE001
+        pass
+
+
+def _run_one(task_type: str, task: Task) -> TaskResult:
+    """Resolve and execute a task handler inside an isolated worker process."""
+    return _get_handler(task_type)(task)
+
+
+def _new_isolated_worker(log_file: Optional[str]) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_isolated_worker,
+        initargs=(log_file,),
+    )
+
+
+def _acquire_isolated_worker(log_file: Optional[str]) -> ProcessPoolExecutor:
+    """Take an idle worker for one task, spawning a fresh one if none is free."""
+    with _isolated_workers_lock:
+        if _idle_isolated_workers:
+            return _idle_isolated_workers.pop()
+    return _new_isolated_worker(log_file)
+
+
+def _release_isolated_worker(worker: ProcessPoolExecutor) -> None:
+    """Park a healthy worker for reuse, or shut it down if enough are idle."""
+    with _isolated_workers_lock:
+        if len(_idle_isolated_workers) < ISOLATED_MAX_WORKERS:
+            _idle_isolated_workers.append(worker)
+            return
+    worker.shutdown(wait=False)
+
+
+def _prewarm_isolated_pool(log_file: Optional[str], workers: int) -> None:
+    """Start ``workers`` worker processes now so spawn cost overlaps setup.
+
+    Each spawned interpreter re-imports the runner, which costs far more than
+    a thread start; priming with a trivial job moves that off the first task.
+    """
+    for _ in range(min(workers, ISOLATED_MAX_WORKERS)):
+        worker = _new_isolated_worker(log_file)
+        worker.submit(os.getpid)
+        _release_isolated_worker(worker)
+
+
+def _shutdown_isolated_pool() -> None:
+    """Shut down the idle workers, waiting for them to exit."""
+    with _isolated_workers_lock:
+        workers = list(_idle_isolated_workers)
+        _idle_isolated_workers.clear()
+    for worker in workers:
+        worker.shutdown(wait=True, cancel_futures=True)
+
+
+def _kill_process_tree(pid: int) -> None:
+    """Kill ``pid`` and everything it started (e.g. the tool a handler launched).
+
+    Killing only the worker would leave KVRT, Stinger and the like running
+    after their task has already been reported as timed out.
+    """
+    if psutil is not None:
+        try:
+            parent = psutil.Process(pid)
+            # List children first: once the parent dies they are reparented.
+            procs = parent.children(recursive=True) + [parent]
+        except psutil.Error:
+            return
+        for proc in procs:
+            try:
+                proc.kill()
+            except psutil.Error:
+                pass
+        psutil.wait_procs(procs, timeout=5)
+    elif os.name == "nt":
+        subprocess.run(
+            ["taskkill", "/F", "/T", "/PID", str(pid)],
+            capture_output=True,
+            check=False,
+        )
+    else:
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+
+def run_task_isolated(task_type: str, task: Task, log_file: Optional[str]) -> TaskResult:
+    """Execute ``task`` in a worker process of its own and wait for its result.
+
+    Raises TimeoutError when the task exceeds ``timeout_seconds`` (its worker
+    and everything that worker started are killed) and RuntimeError when the
+    worker dies; callers treat both as task failures. Other isolated tasks
+    running at the same time are unaffected either way.
+    """
+    timeout = task.get("timeout_seconds") or None
+    worker = _acquire_isolated_worker(log_file)
+    reusable = True
+    try:
+        future = worker.submit(_run_one, task_type, task)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            reusable = False
+            for proc in list((getattr(worker, "_processes", None) or {}).values()):
+                _kill_process_tree(proc.pid)
+            raise TimeoutError(f"Task exceeded timeout of {timeout} seconds")
+        except BrokenProcessPool:
+            reusable = False
+            raise RuntimeError("Worker process terminated unexpectedly")
+    finally:
+        if reusable:
+            _release_isolated_worker(worker)
+        else:
+            worker.shutdown(wait=False, cancel_futures=True)
+
+
+def _read_file_bytes(path: str) -> bytearray:
+    """Read a whole file into one preallocated buffer with unbuffered readinto.
+
+    The bytes land directly in the returned bytearray (no intermediate chunks
+    or TextIOWrapper decode); orjson.loads and json.loads both accept it as-is.
+    """
+    with open(path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        buf = bytearray(size)
+        with memoryview(buf) as view:
+            n = 0
+            while n < size:
+                read = f.readinto(view[n:])
+                if not read:  # file shrank while reading
+                    break
+                n += read
+        if n < size:
+            del buf[n:]
+        return buf
+
+
+# Reused stdlib encoders: json.dumps() builds a fresh JSONEncoder on every call
+# that passes options such as default=str.
+_compact_dumps = json.JSONEncoder(separators=(",", ":"), default=str).encode
+_pretty_dumps = json.JSONEncoder(indent=2, default=str).encode
+
+
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON: compact for pipes, indented for files humans read.
+
+    Non-JSON values a handler may leave in its result are encoded with str().
+    """
+    if orjson is not None:
+        try:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=str, option=option)
+        except TypeError:
+            pass  # e.g. ints wider than 64 bits; the stdlib encoder copes
+    if pretty:
+        return _pretty_dumps(obj).encode("utf-8")
+    return _compact_dumps(obj).encode("utf-8")
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write ``data`` plus a newline to stdout in a single buffered write."""
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:  # stdout replaced by a text-only stream
+        sys.stdout.write(data.decode("utf-8") + "\n")
+        sys.stdout.flush()
+        return
+    sys.stdout.flush()  # keep ordering with anything already in the text layer
+    out.write(data + b"\n")
+    out.flush()
+
+
+def _progress_view(result: TaskResult) -> TaskResult:
+    """Return ``result`` with a long ``summary["output"]`` cut to a snippet.
+
+    Progress frames only feed the live preview; the final report still carries
+    the full output for the result renderers. ``output_len`` records the size
+    that was dropped. Short or non-string output is passed through as-is.
+    """
+    summary = result.get("summary")
+    if not isinstance(summary, dict):
+        return result
+    output = summary.get("output")
+    if not isinstance(output, str) or len(output) <= MAX_LOG_SNIPPET:
+        return result
+    trimmed = dict(summary, output=_snip(output), output_len=len(output))
+    return dict(result, summary=trimmed)
+
+
+def _emit_progress(
+    last_result: TaskResult, completed: int, total: int, overall_success: bool
+) -> None:
+    """Emit an incremental PROGRESS_JSON line for UI consumption.
+
+    Only the newly finished result is sent; the UI accumulates ``last_result``
+    and the full ``results`` array arrives once in PROGRESS_JSON_FINAL.
+    Re-sending every prior result made progress output O(N^2) over a run.
+    Values JSON can't represent (paths, datetimes, ...) are sent as strings
+    rather than silently dropping the frame.
+    """
+    progress_obj = {
+        "type": "progress",
+        "completed": completed,
+        "total": total,
+        "last_result": _progress_view(last_result),
+        "overall_status": "success" if overall_success else "completed_with_errors",
+    }
+    try:
+        # Pre-composed line with no args: the record skips %-formatting.
+        _log_info("PROGRESS_JSON:" + _dumps(progress_obj).decode("utf-8"))
+    except Exception as e:  # noqa: BLE001
+        # A frame that can't be encoded (circular refs, odd keys) is dropped;
+        # the run and the final report carry on without it.
+        _LOG.warning("Skipping progress update %d/%d: %s", completed, total, e)
+    flush_logs()
+
+
+def _snip(raw: Any) -> str:
+    """Shorten tool output to MAX_LOG_SNIPPET characters for a log line.
+
+    Slices before any coercion so multi-MB output (smartctl JSON, BleachBit
+    listings) is never copied, and returns short strings untouched. Other
+    values (parsed JSON dicts, lists) are rendered with ``str`` and cut to
+    the same length so the log line stays bounded.
+    """
+    if isinstance(raw, (bytes, bytearray)):
+        text = bytes(raw[:MAX_LOG_SNIPPET]).decode("utf-8", "replace")
+        return text + "..." if len(raw) > MAX_LOG_SNIPPET else text
+    if not isinstance(raw, str):
+        raw = str(raw)
+    if len(raw) <= MAX_LOG_SNIPPET:
+        return raw
+    return raw[:MAX_LOG_SNIPPET] + "..."
+
+
+def _fail_result(task_type: str, reason: str) -> TaskResult:
+    """Build the result recorded for a task that raised or returned garbage."""
+    return {"task_type": task_type, "status": "failure", "summary": {"reason": reason}}
+
+
+def _skip_result(task_type: str, reason: str) -> TaskResult:
+    """Build the result recorded for a task the runner did not execute."""
+    return {"task_type": task_type, "status": "skipped", "summary": {"reason": reason}}
+
+
+def _report_task_result(
+    idx: int, task: Task, task_type: str, total: int, result: TaskResult, span: Any
+) -> None:
+    """Log status markers, Sentry events and output details for a finished task."""
+    status = result.get("status", "unknown")
+    summary = result.get("summary") or _EMPTY
+
+    # Handle both "failure" and "error" as error conditions
+    if status in ("failure", "error"):
+        failure_reason = summary.get("reason") or summary.get("error", "Unknown error")
+        _LOG.error("TASK_FAIL:%d:%s - %s", idx, task_type, failure_reason)
+        if _sentry_active:
+            # Capture task failure in Sentry with proper fingerprinting
+            capture_task_failure(
+                task_type=task_type,
+                failure_reason=failure_reason,
+                task_data=task,
+                extra_context={
+                    "task_index": idx,
+                    "total_tasks": total,
+                    "result_summary": summary or {},
+                    "status_type": status,  # Track whether it was "failure" or "error"
+                },
+            )
+            # Add breadcrumb for task failure (not exception, just failure/error status)
+            add_breadcrumb(
+                f"Task failed: {task_type}",
+                category="task",
+                level="error",
+                task_type=task_type,
+                reason=failure_reason,
+                status=status,
+            )
+    elif status == "skipped":
+        skip_reason = summary.get("reason", "Skipped")
+        _LOG.warning("TASK_SKIP:%d:%s - %s", idx, task_type, skip_reason)
+        if _sentry_active:
+            add_breadcrumb(
+                f"Task skipped: {task_type}",
+                category="task",
+                level="warning",
+                task_type=task_type,
+                reason=skip_reason,
+            )
+    else:
+        _LOG.info("TASK_OK:%d:%s", idx, task_type)
+        if _sentry_active:
+            add_breadcrumb(
+                f"Task completed successfully: {task_type}",
+                category="task",
+                level="info",
+                task_type=task_type,
+            )
+
+        # Set success status on span if available
+        if span:
+            span.set_tag("status", "success")
+
+    # Log additional details if available
+    if summary and isinstance(summary, dict):
+        if "output" in summary and _LOG.isEnabledFor(logging.INFO):
+            _LOG.info(
+                "Task %s completed with output: %s", task_type, _snip(summary["output"])
+            )
+        if "duration_seconds" in summary:
+            _LOG.info(
+                "Task %s took %.2f seconds", task_type, summary["duration_seconds"]
+            )
+            # Add duration to span if available
+            if span:
+                span.set_data("duration_seconds", summary["duration_seconds"])
+
+
+def _report_task_exception(
+    idx: int, task: Task, task_type: str, total: int, exc: Exception, span: Any
+) -> TaskResult:
+    """Log and capture a handler exception, returning the failure result."""
+    _LOG.error("TASK_FAIL:%d:%s - Exception: %s", idx, task_type, str(exc))
+
+    # Capture exception with Sentry with proper fingerprinting
+    if _sentry_active:
+        capture_task_exception(
+            exc,
+            task_type=task_type,
+            task_data=task,
+            extra_context={
+                "task_index": idx,
+                "total_tasks": total,
+            },
+        )
+
+    # Set error status on span if available
+    if span:
+        span.set_tag("status", "error")
+        span.set_tag("error", True)
+
+    return _fail_result(task_type, f"Exception during execution: {exc}")
+
+
+def execute_single_task(
+    idx: int,
+    task: Task,
+    total: int,
+    isolate: bool = False,
+    log_file: Optional[str] = None,
+) -> TaskResult:
+    """Run one task with its status markers, Sentry span and result reporting.
+
+    Never raises: handler exceptions and missing handlers are turned into
+    failure/skipped results so callers can treat every task uniformly.
+    """
+    task_type = task.get("type", "")
+
+    if _handler_spec(task_type) is None:
+        _LOG.warning(
+            "TASK_SKIP:%d:%s - No handler found for task type", idx, task_type
+        )
+        if _sentry_active:
+            add_breadcrumb(
+                f"No handler found for task type: {task_type}",
+                category="task",
+                level="warning",
+                task_type=task_type,
+            )
+        return _skip_result(task_type, "No handler implemented for this task type.")
+
+    _LOG.info("TASK_START:%d:%s", idx, task_type)
+    _LOG.info("Starting task %d/%d: %s", idx + 1, total, task_type)
+    flush_logs()
+
+    # Add Sentry breadcrumb for task start
+    if _sentry_active:
+        add_breadcrumb(
+            f"Starting task: {task_type}",
+            category="task",
+            level="info",
+            task_type=task_type,
+            task_index=idx,
+            total_tasks=total,
+        )
+
+    # Wrap task execution in Sentry span for performance tracking
+    span_cm = (
+        create_task_span(task_type, idx, total, task) if _sentry_active else _NULL_SPAN
+    )
+    with span_cm as span:
+        try:
+            if isolate:
+                result = run_task_isolated(task_type, task, log_file)
+            else:
+                result = _get_handler(task_type)(task)
+            if not isinstance(result, dict) or not isinstance(
+                result.get("summary") or _EMPTY, Mapping
+            ):
+                # Anything else would break reporting and the final report.
+                result = _fail_result(task_type, "Handler returned invalid result")
+            # Inside the try: a reporting error fails this task, not the run.
+            _report_task_result(idx, task, task_type, total, result, span)
+        except Exception as e:
+            return _report_task_exception(idx, task, task_type, total, e, span)
+    return result
+
+
+def _is_exclusive(task: Task) -> bool:
+    """Return True if ``task`` must not overlap with other tasks."""
+    exclusive = task.get("exclusive")
+    if exclusive is not None:
+        return bool(exclusive)
+    return task.get("type", "") in EXCLUSIVE_TASK_TYPES
+
+
+def _batch_cost(batch: List[Tuple[int, Task]]) -> int:
+    """Sum the expected cost of a batch of (index, task) pairs."""
+    return sum(
+        _TASK_COST.get(task.get("type", ""), _DEFAULT_TASK_COST) for _idx, task in batch
+    )
+
+
+def execute_tasks_parallel(
+    tasks: List[Task],
+    max_workers: int,
+    isolate: bool = False,
+    log_file: Optional[str] = None,
+) -> Tuple[List[TaskResult], bool]:
+    """Run independent tasks concurrently, then exclusive tasks one at a time.
+
+    Handlers are subprocess/I/O bound and release the GIL while waiting, so a
+    thread pool overlaps them. Progress lines are emitted from this (calling)
+    thread only, as each task finishes. Results are returned in plan order so
+    indices in the final report still line up with the UI's task list.
+
+    Returns (results, overall_success).
+    """
+    total = len(tasks)
+    results: List[Optional[TaskResult]] = [None] * total
+    overall_success = True
+    completed = 0
+
+    concurrent_tasks: List[Tuple[int, Task]] = []
+    exclusive_tasks: List[Tuple[int, Task]] = []
+    for idx, task in enumerate(tasks):
+        (exclusive_tasks if _is_exclusive(task) else concurrent_tasks).append(
+            (idx, task)
+        )
+
+    def _record(idx: int, result: TaskResult) -> None:
+        nonlocal overall_success, completed
+        # Handle both "failure" and "error" as error conditions
+        if result.get("status", "unknown") in ("failure", "error"):
+            overall_success = False
+        results[idx] = result
+        completed += 1
+        _emit_progress(result, completed, total, overall_success)
+
+    # Workers hand back each result as soon as its task finishes, so a quick
+    # task sharing a batch reaches the UI without waiting for its batch-mates.
+    # A batch that dies outside execute_single_task() posts its Future (index
+    # -1) so the error surfaces here instead of leaving the loop waiting.
+    finished: "queue.Queue[Tuple[int, Any]]" = queue.Queue()
+
+    def _run_batch(batch: List[Tuple[int, Task]]) -> None:
+        for idx, task in batch:
+            result = execute_single_task(idx, task, total, isolate, log_file)
+            finished.put((idx, result))
+
+    def _on_batch_done(future: Any) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            finished.put((-1, future))
+
+    if concurrent_tasks:
+        # Cheap tasks share a Future in small groups; anything heavier gets
+        # its own so long runs never queue behind each other in one worker.
+        # Isolated tasks and those with a timeout_seconds budget also run
+        # alone: a spawn or a hang that runs to its timeout would otherwise
+        # hold up every batch-mate behind it.
+        slow_batches: List[List[Tuple[int, Task]]] = []
+        fast_batches: List[List[Tuple[int, Task]]] = []
+        cheap: List[Tuple[int, Task]] = []
+        for item in concurrent_tasks:
+            cost = _TASK_COST.get(item[1].get("type", ""), _DEFAULT_TASK_COST)
+            if cost > _CHEAP_TASK_COST:
+                slow_batches.append([item])
+                continue
+            if isolate or item[1].get("timeout_seconds"):
+                fast_batches.append([item])
+                continue
+            cheap.append(item)
+            if len(cheap) == _CHEAP_BATCH_SIZE:
+                fast_batches.append(cheap)
+                cheap = []
+        if cheap:
+            fast_batches.append(cheap)
+
+        # Longest first (LPT) so heavy runs start immediately instead of
+        # becoming the tail after all the quick ones; results are recorded by
+        # plan index, so ordering here never changes the report.
+        slow_batches.sort(key=_batch_cost, reverse=True)
+
+        # Split the worker budget between two tiers so quick reports are not
+        # stuck behind multi-minute scans. A tier with no work lends all of
+        # its share to the other.
+        fast_workers = 0
+        if fast_batches:
+            fast_workers = min(len(fast_batches), max(1, max_workers // 2))
+            if not slow_batches:
+                fast_workers = min(len(fast_batches), max_workers)
+        slow_workers = max(1, max_workers - fast_workers)
+
+        futures = []
+        for tier, workers, batches in (
+            ("slow", slow_workers, slow_batches),
+            ("fast", fast_workers, fast_batches),
+        ):
+            if not batches:
+                continue
+            executor = _get_task_executor(tier, workers)
+            for batch in batches:
+                future = executor.submit(_run_batch, batch)
+                future.add_done_callback(_on_batch_done)
+                futures.append(future)
+        try:
+            for _ in range(len(concurrent_tasks)):
+                idx, item = finished.get()
+                if idx < 0:
+                    item.result()  # re-raises the batch's exception
+                _record(idx, item)
+        except BaseException:
+            # Interrupted (or a batch blew up outside its own try): don't
+            # start queued work on the way out.
+            for future in futures:
+                future.cancel()
+            raise
+
+    for idx, task in exclusive_tasks:
+        _record(idx, execute_single_task(idx, task, total, isolate, log_file))
+
+    # Every slot is filled by now: execute_single_task() turns handler
+    # exceptions and invalid results into failure results rather than raising,
+    # and an interrupted wait re-raises above instead of returning a partial
+    # list.
+    return cast(List[TaskResult], results), overall_success
+
+
+def _extract_run_config(input_data: Any) -> Tuple[List[Task], bool, bool]:
+    """Normalise parsed plan input into ``(tasks, isolate_tasks, parallel)``.
+
+    Accepts ``{"tasks": [...]}``, a single task dict, or a bare list of tasks;
+    anything else yields no tasks. Run options only exist on the dict form.
+    """
+    if isinstance(input_data, dict):
+        raw = input_data.get("tasks")
+        if isinstance(raw, list):
+            tasks = raw
+        elif "type" in input_data:
+            # Single task object shorthand
+            tasks = [input_data]
+        else:
+            tasks = []
+        return (
+            tasks,
+            bool(input_data.get("isolate_tasks", False)),
+            bool(input_data.get("parallel_execution", False)),
+        )
+    if isinstance(input_data, list):
+        return input_data, False, False
+    return [], False, False
 
 
 def main():
@@ -238,62 +1140,101 @@ def main():
         default=None,
         help="Optional path to write a live log file (in addition to stderr).",
     )
+    parser.add_argument(
+        "--fsync-log",
+        dest="fsync_log",
+        action="store_true",
+        help="fsync the --log-file to disk once when the run finishes.",
+    )
+    parser.add_argument(
+        "--max-parallel",
+        dest="max_parallel",
+        type=int,
+        default=None,
+        help=(
+            "Run independent tasks on up to N worker threads. Defaults to "
+            f"{DEFAULT_MAX_PARALLEL} when the plan sets parallel_execution, else 1."
+        ),
+    )
     args = parser.parse_args()
 
     # Configure file logging if requested
+    fh = None
+    log_file_error = None
     if args.log_file:
         try:
-            os.makedirs(os.path.dirname(args.log_file), exist_ok=True)
-            fh = logging.FileHandler(args.log_file, encoding="utf-8")
+            log_dir = os.path.dirname(args.log_file)
+            if log_dir:
+                # makedirs("") raises, so a bare filename needs no directory.
+                os.makedirs(log_dir, exist_ok=True)
+            # Opened eagerly: the runner logs straight away, and an unwritable
+            # path is then reported below instead of failing on first emit.
+            fh = BufferedFileHandler(args.log_file, encoding="utf-8")
             fh.setFormatter(logging.Formatter(_DEFAULT_LOG_FMT))
-            logging.getLogger().addHandler(fh)
-            logging.info("Log file initialized: %s", args.log_file)
-            flush_logs()
         except Exception as e:  # noqa: BLE001
-            logging.error("Failed to initialize log file '%s': %s", args.log_file, e)
-            flush_logs()
+            log_file_error = e
+    start_log_listener(fh)
+    if fh is not None:
+        _LOG.info("Log file initialized: %s", args.log_file)
+    elif log_file_error is not None:
+        _LOG.error(
+            "Failed to initialize log file '%s': %s", args.log_file, log_file_error
+        )
+    flush_logs()
 
     # Elevation (Windows only): avoid confusing failures for tools that need admin rights.
     if os.name == "nt" and not is_admin():
-        logging.info("Attempting to elevate privileges via UAC prompt…")
+        _LOG.info("Attempting to elevate privileges via UAC prompt…")
         # Preserve arguments; include script/module path in argv for Python launched interpreter
         argv = sys.argv[0:]
         code = relaunch_elevated(argv)
         if code != 0:
-            logging.error("Elevation failed or cancelled (code %s)", code)
+            _LOG.error("Elevation failed or cancelled (code %s)", code)
             sys.exit(code)
         # Relaunch initiated successfully; exit unelevated instance so elevated one can proceed
         sys.exit(0)
 
     raw_input = args.json_input
-    logging.info(f"Received input: {raw_input[:MAX_LOG_SNIPPET]}...")
+    _LOG.info("Received input: %s...", raw_input[:MAX_LOG_SNIPPET])
     input_data = None
-    # Allow passing a filename instead of raw JSON
-    if os.path.exists(raw_input) and os.path.isfile(raw_input):
-        logging.info(f"Reading from file: {raw_input}")
+    # Allow passing a filename instead of raw JSON. Inline JSON (or anything
+    # that can't be a Windows path) skips the filesystem probe entirely.
+    # Length first: it is O(1) and rules out large inline payloads before the
+    # lstrip() copy or newline scan touch them.
+    is_path_candidate = (
+        len(raw_input) < 260
+        and not raw_input.lstrip().startswith(("{", "["))
+        and "\n" not in raw_input
+    )
+    if is_path_candidate and os.path.isfile(raw_input):
+        _LOG.info("Reading from file: %s", raw_input)
         try:
-            with open(raw_input, "r", encoding="utf-8") as f:
-                input_data = json.load(f)
+            input_data = _loads(_read_file_bytes(raw_input))
         except Exception as e:  # noqa: BLE001
-            logging.error(f"Failed reading JSON file: {e}")
+            _LOG.error("Failed reading JSON file: %s", e)
     if input_data is None:
-        logging.info("Parsing as raw JSON")
+        _LOG.info("Parsing as raw JSON")
         try:
-            input_data = json.loads(raw_input)
+            input_data = _loads(raw_input)
         except json.JSONDecodeError:
-            logging.error("Failed to decode input JSON.")
+            _LOG.error("Failed to decode input JSON.")
             final_report = {
                 "overall_status": "failure",
                 "error": "Invalid JSON input provided.",
                 "results": [],
             }
-            print(json.dumps(final_report, indent=2))
+            _write_stdout(_dumps(final_report))
             sys.exit(1)
 
+    tasks, isolate_tasks, parallel_execution = _extract_run_config(input_data)
+    if isolate_tasks and tasks:
+        # Let worker processes boot while Sentry and logging are set up.
+        _prewarm_isolated_pool(args.log_file, len(tasks))
+
     # Extract Sentry configuration from input (if provided)
-    sentry_config = {}
+    sentry_config = _EMPTY
     if isinstance(input_data, dict):
-        sentry_config = input_data.get("sentry_config", {})
+        sentry_config = input_data.get("sentry_config") or _EMPTY
 
     # Initialize Sentry with configuration from frontend
     sentry_enabled = sentry_config.get("enabled", True)  # default True
@@ -308,254 +1249,55 @@ def main():
         send_system_info=sentry_system_info,
         environment=sentry_config.get("environment"),
     )
+    global _sentry_active
+    _sentry_active = bool(sentry_initialized)
     if sentry_initialized:
         add_breadcrumb("Service runner starting", category="lifecycle", level="info")
 
-    # Extract/normalize tasks: accept {"tasks": [...]}, a single task dict, or a list of tasks.
-    tasks: List[Task] = []
-    try:
-        if isinstance(input_data, dict):
-            if isinstance(input_data.get("tasks"), list):
-                tasks = input_data["tasks"]
-            elif "type" in input_data:
-                # Single task object shorthand
-                tasks = [input_data]
-        elif isinstance(input_data, list):
-            tasks = input_data
-    except Exception:
-        tasks = []
-    logging.info(f"Parsed {len(tasks)} tasks")
-    flush_logs()
+    total = len(tasks)
+    _LOG.info("Parsed %d tasks", total)
     for i, task in enumerate(tasks):
-        logging.info(f"Task {i}: {task.get('type', 'unknown')}")
-        flush_logs()
+        task_type = task.get("type")
+        if isinstance(task_type, str):
+            # Interned so the HANDLER_SPECS / _TASK_COST / handler-cache probes
+            # for this task match their (interned) literal keys by identity.
+            task["type"] = sys.intern(task_type)
+        _LOG.info("Task %d: %s", i, task.get("type", "unknown"))
+    flush_logs()
 
     all_results = []
     overall_success = True
-
-    for idx, task in enumerate(tasks):
-        task_type = task.get("type", "")
-        handler = TASK_HANDLERS.get(task_type) if task_type else None
-
-        if handler:
-            logging.info("TASK_START:%d:%s", idx, task_type)
-            logging.info("Starting task %d/%d: %s", idx + 1, len(tasks), task_type)
-            flush_logs()
-
-            # Add Sentry breadcrumb for task start
-            add_breadcrumb(
-                f"Starting task: {task_type}",
-                category="task",
-                level="info",
-                task_type=task_type,
-                task_index=idx,
-                total_tasks=len(tasks),
+    max_parallel = args.max_parallel
+    if max_parallel is None:
+        max_parallel = DEFAULT_MAX_PARALLEL if parallel_execution else 1
+
+    # A single task gains nothing from the pools, and its lone progress frame
+    # would only duplicate the PROGRESS_JSON_FINAL line emitted right after.
+    if max_parallel > 1 and total > 1:
+        all_results, overall_success = execute_tasks_parallel(
+            tasks, max_parallel, isolate_tasks, args.log_file
+        )
+    else:
+        for idx, task in enumerate(tasks):
+            result = execute_single_task(
+                idx, task, total, isolate_tasks, args.log_file
             )
+            # Handle both "failure" and "error" as error conditions
+            if result.get("status", "unknown") in ("failure", "error"):
+                overall_success = False
+            all_results.append(result)
+            if total > 1:
+                _emit_progress(result, idx + 1, total, overall_success)
 
-            # Wrap task execution in Sentry span for performance tracking
-            with create_task_span(task_type, idx, len(tasks), task) as span:
-                try:
-                    result = handler(task)
-                    status = result.get("status", "unknown")
-
-                    # Handle both "failure" and "error" as error conditions
-                    if status in ("failure", "error"):
-                        overall_success = False
-                        failure_reason = result.get("summary", {}).get(
-                            "reason"
-                        ) or result.get("summary", {}).get("error", "Unknown error")
-                        logging.error(
-                            "TASK_FAIL:%d:%s - %s",
-                            idx,
-                            task_type,
-                            failure_reason,
-                        )
-                        # Capture task failure in Sentry with proper fingerprinting
-                        capture_task_failure(
-                            task_type=task_type,
-                            failure_reason=failure_reason,
-                            task_data=task,
-                            extra_context={
-                                "task_index": idx,
-                                "total_tasks": len(tasks),
-                                "result_summary": result.get("summary", {}),
-                                "status_type": status,  # Track whether it was "failure" or "error"
-                            },
-                        )
-                        # Add breadcrumb for task failure (not exception, just failure/error status)
-                        add_breadcrumb(
-                            f"Task failed: {task_type}",
-                            category="task",
-                            level="error",
-                            task_type=task_type,
-                            reason=failure_reason,
-                            status=status,
-                        )
-                    elif status == "skipped":
-                        logging.warning(
-                            "TASK_SKIP:%d:%s - %s",
-                            idx,
-                            task_type,
-                            result.get("summary", {}).get("reason", "Skipped"),
-                        )
-                        add_breadcrumb(
-                            f"Task skipped: {task_type}",
-                            category="task",
-                            level="warning",
-                            task_type=task_type,
-                            reason=result.get("summary", {}).get("reason", "Skipped"),
-                        )
-                    else:
-                        logging.info("TASK_OK:%d:%s", idx, task_type)
-                        add_breadcrumb(
-                            f"Task completed successfully: {task_type}",
-                            category="task",
-                            level="info",
-                            task_type=task_type,
-                        )
-
-                        # Set success status on span if available
-                        if span:
-                            span.set_tag("status", "success")
-
-                    flush_logs()
-
-                    # Log additional details if available
-                    summary = result.get("summary", {})
-                    if summary and isinstance(summary, dict):
-                        if "output" in summary:
-                            out_text = str(summary["output"])  # ensure sliceable string
-                            logging.info(
-                                "Task %s completed with output: %s",
-                                task_type,
-                                out_text[:MAX_LOG_SNIPPET] + "..."
-                                if len(out_text) > MAX_LOG_SNIPPET
-                                else out_text,
-                            )
-                            flush_logs()
-                        if "duration_seconds" in summary:
-                            logging.info(
-                                "Task %s took %.2f seconds",
-                                task_type,
-                                summary["duration_seconds"],
-                            )
-                            flush_logs()
-                            # Add duration to span if available
-                            if span:
-                                span.set_data(
-                                    "duration_seconds", summary["duration_seconds"]
-                                )
-
-                    all_results.append(result)
-                    # Emit incremental progress JSON line for UI consumption
-                    try:
-                        progress_obj = {
-                            "type": "progress",
-                            "completed": len(all_results),
-                            "total": len(tasks),
-                            "last_result": result,
-                            "results": all_results,
-                            "overall_status": "success"
-                            if overall_success
-                            else "completed_with_errors",
-                        }
-                        logging.info("PROGRESS_JSON:%s", json.dumps(progress_obj))
-                        flush_logs()
-                    except Exception:
-                        pass
-
-                except Exception as e:
-                    overall_success = False
-                    logging.error(
-                        "TASK_FAIL:%d:%s - Exception: %s", idx, task_type, str(e)
-                    )
-                    flush_logs()
-
-                    # Capture exception with Sentry with proper fingerprinting
-                    capture_task_exception(
-                        e,
-                        task_type=task_type,
-                        task_data=task,
-                        extra_context={
-                            "task_index": idx,
-                            "total_tasks": len(tasks),
-                        },
-                    )
-
-                    # Set error status on span if available
-                    if span:
-                        span.set_tag("status", "error")
-                        span.set_tag("error", True)
-
-                    failure_result = {
-                        "task_type": task_type,
-                        "status": "failure",
-                        "summary": {"reason": f"Exception during execution: {str(e)}"},
-                    }
-                    all_results.append(failure_result)
-                    try:
-                        progress_obj = {
-                            "type": "progress",
-                            "completed": len(all_results),
-                            "total": len(tasks),
-                            "last_result": failure_result,
-                            "results": all_results,
-                            "overall_status": "success"
-                            if overall_success
-                            else "completed_with_errors",
-                        }
-                        logging.info("PROGRESS_JSON:%s", json.dumps(progress_obj))
-                        flush_logs()
-                    except Exception:
-                        pass
-
-        else:
-            logging.warning(
-                "TASK_SKIP:%d:%s - No handler found for task type", idx, task_type
-            )
-            flush_logs()
-            add_breadcrumb(
-                f"No handler found for task type: {task_type}",
-                category="task",
-                level="warning",
-                task_type=task_type,
-            )
-            skipped_result = {
-                "task_type": task_type,
-                "status": "skipped",
-                "summary": {"reason": f"No handler implemented for this task type."},
-            }
-            all_results.append(skipped_result)
-            try:
-                progress_obj = {
-                    "type": "progress",
-                    "completed": len(all_results),
-                    "total": len(tasks),
-                    "last_result": skipped_result,
-                    "results": all_results,
-                    "overall_status": "success"
-                    if overall_success
-                    else "completed_with_errors",
-                }
-                logging.info("PROGRESS_JSON:%s", json.dumps(progress_obj))
-                flush_logs()
-            except Exception:
-                pass
+    _shutdown_task_executor()
+    _shutdown_isolated_pool()
 
     # Collect system metadata
-    import platform
-    import getpass
-
-    system_metadata = {
-        "hostname": platform.node(),
-        "username": getpass.getuser(),
-        "os_name": platform.system(),
-        "os_version": platform.version(),
-    }
+    system_metadata = dict(_system_metadata())
 
     # Include metadata from input_data if provided (only if input_data is a dict)
     if isinstance(input_data, dict):
-        metadata = input_data.get("metadata", {})
+        metadata = input_data.get("metadata") or _EMPTY
         if metadata:
             system_metadata.update(metadata)
 
@@ -566,28 +1308,37 @@ def main():
     }
 
     # Add final breadcrumb
-    add_breadcrumb(
-        f"Service run completed: {final_report['overall_status']}",
-        category="lifecycle",
-        level="info" if overall_success else "warning",
-        total_tasks=len(tasks),
-        completed_tasks=len(all_results),
-        overall_status=final_report["overall_status"],
-    )
+    if _sentry_active:
+        add_breadcrumb(
+            f"Service run completed: {final_report['overall_status']}",
+            category="lifecycle",
+            level="info" if overall_success else "warning",
+            total_tasks=total,
+            completed_tasks=len(all_results),
+            overall_status=final_report["overall_status"],
+        )
+
+    # Encode the results array once; it is by far the largest part of the
+    # report and is shared by the stdout report and PROGRESS_JSON_FINAL.
+    results_json = _dumps(all_results)
+    status_json = _dumps(final_report["overall_status"])
 
     # Print the final JSON report to stdout for the parent process (AutoService) to capture.
-    report_json = json.dumps(final_report, indent=2)
-    print(report_json)
+    # The app parses stdout as JSON, so keep it compact; indentation is only
+    # worth its 2-4x size for the human-readable --output-file copy.
+    _write_stdout(
+        b'{"overall_status":%s,"results":%s,"metadata":%s}'
+        % (status_json, results_json, _dumps(system_metadata))
+    )
     # Also emit final progress snapshot as PROGRESS_JSON_FINAL for UI
     try:
-        final_progress = {
-            "type": "final",
-            "completed": len(all_results),
-            "total": len(tasks),
-            "results": all_results,
-            "overall_status": final_report["overall_status"],
-        }
-        logging.info("PROGRESS_JSON_FINAL:%s", json.dumps(final_progress))
+        _LOG.info(
+            _FINAL_PROGRESS_TEMPLATE,
+            len(all_results),
+            total,
+            results_json.decode("utf-8"),
+            status_json.decode("utf-8"),
+        )
     except Exception:
         pass
     flush_logs()
@@ -597,19 +1348,51 @@ def main():
     if output_path:
         try:
             dirpath = os.path.dirname(output_path)
-            if dirpath:
+            # The reports folder almost always exists; one stat beats makedirs'
+            # per-component probing on the common path.
+            if dirpath and not os.path.isdir(dirpath):
                 os.makedirs(dirpath, exist_ok=True)
-            with open(output_path, "w", encoding="utf-8") as out_f:
-                out_f.write(report_json)
-            logging.info(f"Final report written to '{output_path}'")
+            # Write to a sibling temp file then atomically swap it in so a
+            # killed runner never leaves a truncated report for the app to read.
+            # mkstemp gives each run its own name (opened binary on Windows),
+            # so concurrent runs can't clobber each other's temp file.
+            payload = _dumps(final_report, pretty=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=dirpath or os.curdir,
+                prefix=os.path.basename(output_path) + ".",
+                suffix=".tmp",
+            )
+            try:
+                try:
+                    if hasattr(os, "fchmod"):
+                        # mkstemp creates 0600; keep reports readable as before.
+                        os.fchmod(fd, 0o644)
+                    view = memoryview(payload)
+                    while view:
+                        view = view[os.write(fd, view) :]
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, output_path)
+            except BaseException:
+                # Don't leave a stray temp file in the reports directory.
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            _LOG.info("Final report written to '%s'", output_path)
             flush_logs()
         except Exception as e:  # noqa: BLE001
-            logging.error(f"Failed to write final report to '{output_path}': {e}")
+            _LOG.error("Failed to write final report to '%s': %s", output_path, e)
             flush_logs()
     else:
-        logging.info("No --output-file provided; final report not written to disk.")
+        _LOG.info("No --output-file provided; final report not written to disk.")
         flush_logs()
 
+    stop_log_listener(fsync=args.fsync_log)
+
 
 if __name__ == "__main__":
+    # Required so spawned isolation workers start correctly in frozen builds.
+    multiprocessing.freeze_support()
     main()
@@ -26,6 +26,10 @@ except ImportError:
         pass
 
 
+# Section header, e.g. "***** [ Registry ] *****"; compiled once at import.
+_SECTION_RE = re.compile(r"\*{5} \[ (.+?) \] \*{5}")
+
+
 def parse_adwcleaner_log(log_path: str) -> Dict[str, Any]:
     """Parse the latest AdwCleaner log file and return structured data."""
     summary = {
@@ -77,12 +81,13 @@ def parse_adwcleaner_log(log_path: str) -> Dict[str, Any]:
                 except ValueError:
                     pass
 
-            # section headers
-            m = re.match(r"\*{5} \[ (.+?) \] \*{5}", line)
-            if m:
-                section = m.group(1).strip()
-                current_section = section_map.get(section)
-                continue
+            # section headers (cheap prefix test first; most lines are entries)
+            if line.startswith("*****"):
+                m = _SECTION_RE.match(line)
+                if m:
+                    section = m.group(1).strip()
+                    current_section = section_map.get(section)
+                    continue
 
             # section content
             if current_section:
@@ -154,7 +159,7 @@ def run_adwcleaner_clean(task: Dict[str, Any]) -> Dict[str, Any]:
     if clean_preinstalled:
         command.append("/preinstalled")
 
-    logger.info(f"Executing command: {' '.join(command)}")
+    logger.info("Executing command: %s", " ".join(command))
 
     add_breadcrumb(
         "Executing AdwCleaner",
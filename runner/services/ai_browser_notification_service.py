@@ -636,7 +636,7 @@ def run_ai_browser_notification_disable(task: Dict[str, Any]) -> Dict[str, Any]:
         },
     )
 
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     api_key = task.get("api_key")
     model = task.get("model")
@@ -689,7 +689,7 @@ def run_ai_browser_notification_disable(task: Dict[str, Any]) -> Dict[str, Any]:
     if not notifications:
         logger.info("No browser notification permissions found.")
         sys.stderr.flush()
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         return {
             "task_type": "ai_browser_notification_disable",
             "status": "success",
@@ -737,7 +737,7 @@ def run_ai_browser_notification_disable(task: Dict[str, Any]) -> Dict[str, Any]:
     if not ai_response.get("success"):
         logger.error(f"AI analysis failed: {ai_response.get('error')}")
         sys.stderr.flush()
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         return {
             "task_type": "ai_browser_notification_disable",
             "status": "error",
@@ -867,7 +867,7 @@ def run_ai_browser_notification_disable(task: Dict[str, Any]) -> Dict[str, Any]:
             logger.info(f"  {idx}. {entry.get('origin')} - {entry.get('reason')}")
         sys.stderr.flush()
 
-    duration = time.time() - start_time
+    duration = time.perf_counter() - start_time
 
     # Build standardized result
     status = "success"
@@ -690,7 +690,7 @@ def run_ai_startup_disable(task: Dict[str, Any]) -> Dict[str, Any]:
         },
     )
 
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     api_key = task.get("api_key")
     model = task.get("model")
@@ -930,7 +930,7 @@ def run_ai_startup_disable(task: Dict[str, Any]) -> Dict[str, Any]:
             logger.info(f"  {idx}. {entry.get('name')} - {entry.get('reason')}")
         sys.stderr.flush()
 
-    duration = time.time() - start_time
+    duration = time.perf_counter() - start_time
 
     # Build standardized result
     status = "success"
@@ -7,7 +7,9 @@ structured metrics (space reclaimed, files deleted, etc.).
 import subprocess
 import re
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional
 import os
 
 logger = logging.getLogger(__name__)
@@ -24,59 +26,65 @@ except ImportError:
         pass
 
 
+# All four summary fields in one alternation, so the output is scanned in a
+# single pass. Count groups are named after their summary keys. [^\S\n]
+# (whitespace except newline) keeps each match on one line, as the old
+# per-line scan did.
+_SUMMARY_RE = re.compile(
+    r"Disk space recovered:[^\S\n]*(?P<space>\d+(?:\.\d+)?)"
+    r"[^\S\n]*(?P<unit>[kKmMgG]B)?"
+    r"|Files deleted:[^\S\n]*(?P<files_deleted>\d+)"
+    r"|Special operations:[^\S\n]*(?P<special_operations>\d+)"
+    r"|Errors:[^\S\n]*(?P<errors>\d+)"
+)
+
+
+# Binary multiplier by the first letter of BleachBit's size suffix.
+_UNIT_MULT = {"k": 1 << 10, "m": 1 << 20, "g": 1 << 30}
+
+
+def _convert_to_bytes(value, unit):
+    """Scale a BleachBit size by its kB/MB/GB suffix (binary multiples)."""
+    if not unit:
+        return value
+    return value * _UNIT_MULT.get(unit[0].lower(), 1)
+
+
 def parse_bleachbit_output(output: str) -> Dict[str, Any]:
     """Parse stdout from bleachbit_console.exe to extract structured data.
 
     Returns a dict with keys: space_recovered_bytes, files_deleted, special_operations, errors.
     """
-    summary = {
+    summary = _empty_summary()
+    _update_summary(summary, output)
+    return summary
+
+
+def _empty_summary() -> Dict[str, Any]:
+    return {
         "space_recovered_bytes": 0,
         "files_deleted": 0,
         "special_operations": 0,
         "errors": 0,
     }
 
-    patterns = {
-        "space_recovered_bytes": re.compile(
-            r"Disk space recovered:\s*(\d+(\.\d+)?)\s*([kKmMgG]B)?"
-        ),
-        "files_deleted": re.compile(r"Files deleted:\s*(\d+)"),
-        "special_operations": re.compile(r"Special operations:\s*(\d+)"),
-        "errors": re.compile(r"Errors:\s*(\d+)"),
-    }
 
-    def convert_to_bytes(value, unit):
-        if unit:
-            unit = unit.lower()
-            if unit.startswith("k"):
-                return value * 1024
-            if unit.startswith("m"):
-                return value * 1024**2
-            if unit.startswith("g"):
-                return value * 1024**3
-        return value
+def _update_summary(summary: Dict[str, Any], text: str) -> None:
+    """Fold any summary fields found in ``text`` into ``summary`` (last wins)."""
+    for match in _SUMMARY_RE.finditer(text):
+        space = match.group("space")
+        if space is not None:
+            summary["space_recovered_bytes"] = int(
+                _convert_to_bytes(float(space), match.group("unit"))
+            )
+        else:
+            key = match.lastgroup
+            summary[key] = int(match.group(key))
 
-    for line in output.splitlines():
-        if "Disk space recovered" in line:
-            match = patterns["space_recovered_bytes"].search(line)
-            if match:
-                value = float(match.group(1))
-                unit = match.group(3)
-                summary["space_recovered_bytes"] = int(convert_to_bytes(value, unit))
-        elif "Files deleted" in line:
-            match = patterns["files_deleted"].search(line)
-            if match:
-                summary["files_deleted"] = int(match.group(1))
-        elif "Special operations" in line:
-            match = patterns["special_operations"].search(line)
-            if match:
-                summary["special_operations"] = int(match.group(1))
-        elif "Errors" in line:
-            match = patterns["errors"].search(line)
-            if match:
-                summary["errors"] = int(match.group(1))
 
-    return summary
+# Lines of stdout kept for the error details when BleachBit fails.
+_STDOUT_TAIL_LINES = 200
+_PIPE_BUFSIZE = 64 * 1024
 
 
 def _resolve_bleachbit_console_path(exec_path: str) -> Optional[str]:
@@ -147,7 +155,7 @@ def run_bleachbit_clean(task: Dict[str, Any]) -> Dict[str, Any]:
         }
 
     command = [exec_path, "--clean", *options]
-    logger.info(f"Executing command: {' '.join(command)}")
+    logger.info("Executing command: %s", " ".join(command))
 
     add_breadcrumb(
         "Executing BleachBit",
@@ -157,18 +165,38 @@ def run_bleachbit_clean(task: Dict[str, Any]) -> Dict[str, Any]:
     )
 
     try:
-        process = subprocess.run(
+        # Stream stdout so the (often long) per-file listing is parsed as it
+        # arrives instead of being held in memory in full. stderr is drained
+        # on a thread so neither pipe can fill up and stall BleachBit.
+        summary_data = _empty_summary()
+        # Only the tail is kept, for the error details on failure.
+        stdout_tail: Deque[str] = deque(maxlen=_STDOUT_TAIL_LINES)
+        stderr_chunks: List[str] = []
+        with subprocess.Popen(
             command,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            check=False,
             encoding="utf-8",
             errors="replace",
+            # Read the pipe in 64 KiB blocks (a full pipe buffer) rather than
+            # the 8 KiB default; lines are still split from the text layer.
+            bufsize=_PIPE_BUFSIZE,
             cwd=os.path.dirname(exec_path) or None,
-        )
+        ) as process:
+            stderr_thread = threading.Thread(
+                target=lambda: stderr_chunks.append(process.stderr.read()),
+                daemon=True,
+            )
+            stderr_thread.start()
+            for line in process.stdout:
+                _update_summary(summary_data, line)
+                stdout_tail.append(line)
+            stderr_thread.join()
+            process.wait()
 
-        stdout = process.stdout or ""
-        stderr = process.stderr or ""
+        stdout = "".join(stdout_tail)
+        stderr = "".join(stderr_chunks)
 
         if process.returncode != 0:
             # Provide a more helpful hint for common Windows error 120 when the GUI exe was used
@@ -193,7 +221,6 @@ def run_bleachbit_clean(task: Dict[str, Any]) -> Dict[str, Any]:
             }
 
         logger.info("BleachBit task completed successfully.")
-        summary_data = parse_bleachbit_output(stdout)
 
         add_breadcrumb(
             "BleachBit completed",
@@ -214,14 +241,14 @@ def run_bleachbit_clean(task: Dict[str, Any]) -> Dict[str, Any]:
         }
 
     except FileNotFoundError:
-        logger.error(f"BleachBit executable not found at '{exec_path}'.")
+        logger.error("BleachBit executable not found at '%s'.", exec_path)
         return {
             "task_type": "bleachbit_clean",
             "status": "failure",
             "summary": {"error": f"File not found: {exec_path}"},
         }
     except Exception as e:  # noqa: BLE001
-        logger.error(f"An unexpected error occurred while running BleachBit: {e}")
+        logger.error("An unexpected error occurred while running BleachBit: %s", e)
         return {
             "task_type": "bleachbit_clean",
             "status": "failure",
@@ -184,7 +184,7 @@ def run_chkdsk_scan(task: Dict[str, Any]) -> Dict[str, Any]:
         data={"mode": mode},
     )
 
-    started = time.time()
+    started = time.perf_counter()
     try:
         proc = subprocess.run(
             command,
@@ -224,7 +224,7 @@ def run_chkdsk_scan(task: Dict[str, Any]) -> Dict[str, Any]:
             },
         }
 
-    ended = time.time()
+    ended = time.perf_counter()
     output = (proc.stdout or "") + ("\n" + proc.stderr if proc.stderr else "")
     parsed = parse_chkdsk_output(output)
     parsed["return_code"] = proc.returncode
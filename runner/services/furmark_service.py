@@ -200,7 +200,7 @@ def run_furmark_test(task: Dict[str, Any]) -> Dict[str, Any]:
         str(int(duration)),
     ] + extra_args
 
-    logger.info(f"Running FurMark: {' '.join(command)}")
+    logger.info("Running FurMark: %s", " ".join(command))
 
     add_breadcrumb(
         "Executing FurMark",
@@ -267,7 +267,7 @@ def run_ping_test(task: Dict[str, Any]) -> Dict[str, Any]:
             except Exception:
                 pass
         command.append(str(host))
-    logger.info(f"Executing ping command: {' '.join(command)}")
+    logger.info("Executing ping command: %s", " ".join(command))
 
     add_breadcrumb(
         "Executing ping command",
@@ -78,7 +78,7 @@ def run_speedtest(task: Dict[str, Any]) -> Dict[str, Any]:
         },
     )
 
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         import speedtest  # type: ignore
@@ -233,7 +233,7 @@ def run_speedtest(task: Dict[str, Any]) -> Dict[str, Any]:
         else:
             rating_stars = 1
 
-        duration_seconds = round(time.time() - start_time, 2)
+        duration_seconds = round(time.perf_counter() - start_time, 2)
 
         add_breadcrumb(
             "Speedtest completed",
@@ -278,7 +278,7 @@ def run_speedtest(task: Dict[str, Any]) -> Dict[str, Any]:
 
     except Exception as e:  # noqa: BLE001
         logger.error("Speedtest failed with exception: %s", e)
-        duration_seconds = round(time.time() - start_time, 2)
+        duration_seconds = round(time.perf_counter() - start_time, 2)
         return {
             "task_type": "speedtest",
             "status": "failure",
@@ -710,7 +710,7 @@ def run_trellix_stinger_scan(task: Dict[str, Any]) -> Dict[str, Any]:
 
     Includes health monitoring, timeout enforcement, and comprehensive error handling.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     add_breadcrumb(
         "Starting Trellix Stinger antivirus scan",
@@ -783,7 +783,7 @@ def run_trellix_stinger_scan(task: Dict[str, Any]) -> Dict[str, Any]:
     exec_path: str = build.get("exec_path", "")
     logs_dir: str = build.get("logs_dir", "")
 
-    logger.info(f"Executing command: {' '.join(command)}")
+    logger.info("Executing command: %s", " ".join(command))
     logger.info(f"Logs will be saved to: {logs_dir}")
 
     add_breadcrumb(
@@ -939,7 +939,7 @@ def run_trellix_stinger_scan(task: Dict[str, Any]) -> Dict[str, Any]:
 
     stdout = stdout or ""
     stderr = stderr or ""
-    scan_duration = time.time() - start_time
+    scan_duration = time.perf_counter() - start_time
 
     # Handle timeout scenario
     if health_status.get("timed_out", False):
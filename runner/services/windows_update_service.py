@@ -708,7 +708,7 @@ def run_windows_update(task: Dict[str, Any]) -> Dict[str, Any]:
         },
     )
 
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     if os.name != "nt":
         logger.error("Windows Update service is only supported on Windows")
@@ -745,7 +745,7 @@ def run_windows_update(task: Dict[str, Any]) -> Dict[str, Any]:
 
     res = _powershell_json(script)
 
-    duration = time.time() - start_time
+    duration = time.perf_counter() - start_time
 
     if not res.get("ok"):
         error_msg = res.get("error") or "PowerShell execution failed"
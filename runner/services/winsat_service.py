@@ -332,7 +332,7 @@ def run_winsat_disk(task: Dict[str, Any]) -> Dict[str, Any]:
         data={"test_mode": test_mode},
     )
 
-    started = time.time()
+    started = time.perf_counter()
     try:
         proc = subprocess.run(
             command,
@@ -359,7 +359,7 @@ def run_winsat_disk(task: Dict[str, Any]) -> Dict[str, Any]:
             },
         }
 
-    ended = time.time()
+    ended = time.perf_counter()
     duration = round(ended - started, 2)
 
     stdout = proc.stdout or ""
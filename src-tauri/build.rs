@@ -347,9 +347,16 @@ fn main() {
     let workpath_str = workpath.to_str().unwrap_or(bin_dir_str);
     let specpath_str = specpath.to_str().unwrap_or(bin_dir_str);
 
+    // The runner imports service modules lazily via importlib, so PyInstaller's
+    // static analysis can't see them; bundle the whole services package.
+    let runner_dir_str = py_src
+        .parent()
+        .and_then(|p| p.to_str())
+        .unwrap_or(".");
+
     println!("cargo:warning=Executing PyInstaller command...");
-    println!("cargo:warning=Command: {} -m PyInstaller --onefile --noconfirm --distpath {} --workpath {} --specpath {} --name {} {}",
-             PYTHON_COMMAND, bin_dir_str, workpath_str, specpath_str, PYTHON_RUNNER_STEM, py_src.display());
+    println!("cargo:warning=Command: {} -m PyInstaller --onefile --noconfirm --distpath {} --workpath {} --specpath {} --paths {} --collect-submodules services --name {} {}",
+             PYTHON_COMMAND, bin_dir_str, workpath_str, specpath_str, runner_dir_str, PYTHON_RUNNER_STEM, py_src.display());
 
     let status = Command::new(PYTHON_COMMAND)
         .arg("-m")
@@ -362,6 +369,10 @@ fn main() {
         .arg(workpath_str)
         .arg("--specpath")
         .arg(specpath_str)
+        .arg("--paths")
+        .arg(runner_dir_str)
+        .arg("--collect-submodules")
+        .arg("services")
         .arg("--name")
         .arg(PYTHON_RUNNER_STEM)
         .arg(py_src.to_str().unwrap())